@@ -9,11 +9,9 @@ import logging
 import os
 import platform
 import socket
+import sys
 import time
 import warnings
-from inspect import currentframe, getouterframes
-
-import amici
 
 LOG_LEVEL_ENV_VAR = "AMICI_LOG"
 BASE_LOGGER_NAME = "amici"
@@ -29,6 +27,11 @@ NAMED_LOG_LEVELS = {
 
 from collections.abc import Callable
 
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s.%(msecs).3d - %(name)s - " "%(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
 
 def _setup_logger(
     level: int | None = logging.WARNING,
@@ -84,31 +87,30 @@ def _setup_logger(
     py_warn_logger = logging.getLogger("py.warnings")
 
     # Remove default logging handler
-    for handler in log.handlers:
-        if handler in py_warn_logger.handlers:
-            py_warn_logger.removeHandler(handler)
+    for handler in set(log.handlers).intersection(py_warn_logger.handlers):
+        py_warn_logger.removeHandler(handler)
     log.handlers = []
 
-    log_fmt = logging.Formatter(
-        "%(asctime)s.%(msecs).3d - %(name)s - " "%(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
     if console_output:
         stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(log_fmt)
+        stream_handler.setFormatter(_LOG_FORMATTER)
         log.addHandler(stream_handler)
 
     if file_output:
         file_handler = logging.FileHandler(file_output)
-        file_handler.setFormatter(log_fmt)
+        file_handler.setFormatter(_LOG_FORMATTER)
         log.addHandler(file_handler)
 
-    log.info("Logging started on AMICI version %s", amici.__version__)
+    # imported here to avoid a circular import
+    from . import __version__
 
-    log.debug("OS Platform: %s", platform.platform())
-    log.debug("Python version: %s", platform.python_version())
-    log.debug("Hostname: %s", socket.getfqdn())
+    log.info("Logging started on AMICI version %s", __version__)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("OS Platform: %s", platform.platform())
+        log.debug("Python version: %s", platform.python_version())
+        # no getfqdn() here, it may block on DNS lookups
+        log.debug("Hostname: %s", socket.gethostname())
 
     if capture_warnings:
         logging.captureWarnings(capture_warnings)
@@ -125,10 +127,9 @@ def set_log_level(logger: logging.Logger, log_level: int | bool) -> None:
         elif not isinstance(log_level, int):
             raise ValueError("log_level must be a boolean, integer or None")
 
-        if logger.getEffectiveLevel() != log_level:
+        if (current_level := logger.getEffectiveLevel()) != log_level:
             logger.debug(
-                "Changing log_level from %d to %d"
-                % (logger.getEffectiveLevel(), log_level)
+                "Changing log_level from %d to %d", current_level, log_level
             )
             logger.setLevel(log_level)
 
@@ -201,12 +202,18 @@ def log_execution_time(description: str, logger: logging.Logger) -> Callable:
     def decorator_timer(func):
         @functools.wraps(func)
         def wrapper_timer(*args, **kwargs):
+            # nothing will be logged, skip timing and stack inspection
+            if not logger.isEnabledFor(logging.INFO):
+                return func(*args, **kwargs)
+
             # append pluses to indicate recursion level
-            recursion_level = sum(
-                frame.function == "wrapper_timer"
-                and frame.filename == __file__
-                for frame in getouterframes(currentframe(), context=0)
-            )
+            # (all wrappers share the code object of this function)
+            recursion_level = 0
+            frame = sys._getframe()
+            wrapper_code = frame.f_code
+            while frame is not None:
+                recursion_level += frame.f_code is wrapper_code
+                frame = frame.f_back
 
             recursion = ""
             level = logging.INFO
@@ -229,7 +236,11 @@ def log_execution_time(description: str, logger: logging.Logger) -> Callable:
             )
             logger.log(
                 level,
-                f"Finished {description}{spacers}{recursion} ({(tend - tstart):.2E}s)",
+                "Finished %s%s%s (%.2Es)",
+                description,
+                spacers,
+                recursion,
+                tend - tstart,
             )
             return rval
 
@@ -5,18 +5,22 @@ This module provides views on C++ objects for efficient access.
 """
 
 import collections
+import contextlib
 import copy
-import itertools
-from typing import Literal, Union
-from collections.abc import Iterator
+import functools
+import weakref
+from typing import TYPE_CHECKING, Literal, Union
+from collections.abc import Callable, Iterator
 from numbers import Number
 import amici
 import numpy as np
-import sympy as sp
-from sympy.abc import _clash
 from . import ExpData, ExpDataPtr, Model, ReturnData, ReturnDataPtr
 
-StrOrExpr = Union[str, sp.Expr]
+if TYPE_CHECKING:
+    # sympy is only needed for `evaluate` and is slow to import
+    import sympy as sp
+
+StrOrExpr = Union[str, "sp.Expr"]
 
 
 class SwigPtrView(collections.abc.Mapping):
@@ -29,14 +33,23 @@ class SwigPtrView(collections.abc.Mapping):
 
     :ivar _swigptr: pointer to the C++ object
     :ivar _field_names: names of members that will be exposed as numpy arrays
+    :ivar _field_names_set: ``_field_names`` as set for fast membership tests
+    :ivar _field_getters: names of getter methods for fields that are not
+        direct members of the C++ object
     :ivar _field_dimensions: dimensions of numpy arrays
     :ivar _cache: dictionary with cached values
     """
 
     _swigptr = None
-    _field_names: list[str] = []
+    _field_names: tuple[str, ...] = ()
+    _field_names_set: frozenset[str] = frozenset()
+    _field_getters: dict[str, str] = {}
     _field_dimensions: dict[str, list[int]] = dict()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_names_set = frozenset(cls._field_names)
+
     def __getitem__(self, item: str) -> np.ndarray | float:
         """
         Access to field names, copies data from C++ object into numpy
@@ -49,16 +62,28 @@ class SwigPtrView(collections.abc.Mapping):
         if self._swigptr is None:
             raise NotImplementedError("Cannot get items from abstract class.")
 
+        try:
+            return self._cache[item]
+        except KeyError:
+            pass
+
         if item == "ptr":
             return self._swigptr
 
-        if item in self._cache:
-            return self._cache[item]
-
-        if item in self._field_names:
-            value = _field_as_numpy(
-                self._field_dimensions, item, self._swigptr
-            )
+        if item in self._field_names_set:
+            # convert to numpy array with the respective field dimensions
+            if getter := self._field_getters.get(item):
+                value = getattr(self._swigptr, getter)()
+            else:
+                value = getattr(self._swigptr, item)
+            if field_dim := self._field_dimensions.get(item):
+                value = (
+                    np.asarray(value).reshape(field_dim)
+                    if len(value)
+                    else None
+                )
+            elif isinstance(value, Number):
+                value = float(value)
             self._cache[item] = value
 
             return value
@@ -121,10 +146,9 @@ class SwigPtrView(collections.abc.Mapping):
 
         :return: SwigPtrView shallow copy
         """
-        other = SwigPtrView(self._swigptr)
-        other._field_names = self._field_names
-        other._field_dimensions = self._field_dimensions
-        other._cache = self._cache
+        # same class and attributes, sharing the pointer and the cache
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
         return other
 
     def __contains__(self, item) -> bool:
@@ -135,7 +159,7 @@ class SwigPtrView(collections.abc.Mapping):
 
         :returns: whether item is available as key
         """
-        return item in self._field_names
+        return item in self._field_names_set
 
     def __deepcopy__(self, memo):
         """
@@ -147,9 +171,16 @@ class SwigPtrView(collections.abc.Mapping):
         """
         # We assume we have a copy-ctor for the swigptr object
         other = self.__class__(copy.deepcopy(self._swigptr))
-        other._field_names = copy.deepcopy(self._field_names)
-        other._field_dimensions = copy.deepcopy(self._field_dimensions)
-        other._cache = copy.deepcopy(self._cache)
+        other._field_dimensions = {
+            field: list(dims) for field, dims in self._field_dimensions.items()
+        }
+        # ndarray.copy is much cheaper than the generic deepcopy machinery
+        other._cache = {
+            field: value.copy()
+            if isinstance(value, np.ndarray)
+            else copy.deepcopy(value, memo)
+            for field, value in self._cache.items()
+        }
         return other
 
     def __repr__(self):
@@ -173,11 +204,11 @@ class SwigPtrView(collections.abc.Mapping):
         return self._swigptr == other._swigptr
 
     def __dir__(self):
-        return sorted(
-            set(
-                itertools.chain(dir(super()), self.__dict__, self._field_names)
-            )
-        )
+        # the class attributes don't change, only collect them once per class
+        cls = type(self)
+        if (class_dir := cls.__dict__.get("_class_dir")) is None:
+            class_dir = cls._class_dir = frozenset(dir(cls))
+        return sorted(class_dir.union(self.__dict__, self._field_names))
 
 
 class ReturnDataView(SwigPtrView):
@@ -186,7 +217,7 @@ class ReturnDataView(SwigPtrView):
     possibly costly copies of member data.
     """
 
-    _field_names = [
+    _field_names = (
         "ts",
         "x",
         "x0",
@@ -243,7 +274,72 @@ class ReturnDataView(SwigPtrView):
         "cpu_time_total",
         "messages",
         "t_last",
-    ]
+    )
+
+    #: Dimensions of the array-valued fields. Each dimension is either the
+    #: name of a dimension attribute of :class:`amici.ReturnData` (or the
+    #: derived ``nres``, the number of residuals) or a fixed size.
+    _field_dimension_spec = (
+        ("ts", ("nt",)),
+        ("x", ("nt", "nx")),
+        ("x0", ("nx",)),
+        ("x_ss", ("nx",)),
+        ("sx", ("nt", "nplist", "nx")),
+        ("sx0", ("nplist", "nx")),
+        ("sx_ss", ("nplist", "nx")),
+        # observables
+        ("y", ("nt", "ny")),
+        ("sigmay", ("nt", "ny")),
+        ("sy", ("nt", "nplist", "ny")),
+        ("ssigmay", ("nt", "nplist", "ny")),
+        # event observables
+        ("z", ("nmaxevent", "nz")),
+        ("rz", ("nmaxevent", "nz")),
+        ("sigmaz", ("nmaxevent", "nz")),
+        ("sz", ("nmaxevent", "nplist", "nz")),
+        ("srz", ("nmaxevent", "nplist", "nz")),
+        ("ssigmaz", ("nmaxevent", "nplist", "nz")),
+        # objective function
+        ("sllh", ("nplist",)),
+        ("s2llh", ("np", "nplist")),
+        ("res", ("nres",)),
+        ("sres", ("nres", "nplist")),
+        ("FIM", ("nplist", "nplist")),
+        # diagnosis
+        ("J", ("nx_solver", "nx_solver")),
+        ("w", ("nt", "nw")),
+        ("xdot", ("nx_solver",)),
+        ("preeq_numlinsteps", ("newton_maxsteps", 2)),
+        ("preeq_numsteps", (1, 3)),
+        ("preeq_status", (1, 3)),
+        ("posteq_numlinsteps", ("newton_maxsteps", 2)),
+        ("posteq_numsteps", (1, 3)),
+        ("posteq_status", (1, 3)),
+        ("numsteps", ("nt",)),
+        ("numrhsevals", ("nt",)),
+        ("numerrtestfails", ("nt",)),
+        ("numnonlinsolvconvfails", ("nt",)),
+        ("order", ("nt",)),
+        ("numstepsB", ("nt",)),
+        ("numrhsevalsB", ("nt",)),
+        ("numerrtestfailsB", ("nt",)),
+        ("numnonlinsolvconvfailsB", ("nt",)),
+    )
+
+    #: Entity types of the fields that can be subset by entity ID
+    _by_id_entity_types = {
+        "x": "State",
+        "x0": "State",
+        "x_ss": "State",
+        "sx": "State",
+        "sx0": "State",
+        "sx_ss": "State",
+        "w": "Expression",
+        "y": "Observable",
+        "sy": "Observable",
+        "sigmay": "Observable",
+        "sllh": "Parameter",
+    }
 
     def __init__(self, rdata: ReturnDataPtr | ReturnData):
         """
@@ -256,55 +352,16 @@ class ReturnDataView(SwigPtrView):
                 f"Unsupported pointer {type(rdata)}, must be"
                 f"amici.ReturnDataPtr or amici.ReturnData!"
             )
+        dims = rdata._get_dimensions()
+        dims["nres"] = (
+            dims["nt"] * dims["nytrue"] * (2 if dims["sigma_res"] else 1)
+        )
         self._field_dimensions = {
-            "ts": [rdata.nt],
-            "x": [rdata.nt, rdata.nx],
-            "x0": [rdata.nx],
-            "x_ss": [rdata.nx],
-            "sx": [rdata.nt, rdata.nplist, rdata.nx],
-            "sx0": [rdata.nplist, rdata.nx],
-            "sx_ss": [rdata.nplist, rdata.nx],
-            # observables
-            "y": [rdata.nt, rdata.ny],
-            "sigmay": [rdata.nt, rdata.ny],
-            "sy": [rdata.nt, rdata.nplist, rdata.ny],
-            "ssigmay": [rdata.nt, rdata.nplist, rdata.ny],
-            # event observables
-            "z": [rdata.nmaxevent, rdata.nz],
-            "rz": [rdata.nmaxevent, rdata.nz],
-            "sigmaz": [rdata.nmaxevent, rdata.nz],
-            "sz": [rdata.nmaxevent, rdata.nplist, rdata.nz],
-            "srz": [rdata.nmaxevent, rdata.nplist, rdata.nz],
-            "ssigmaz": [rdata.nmaxevent, rdata.nplist, rdata.nz],
-            # objective function
-            "sllh": [rdata.nplist],
-            "s2llh": [rdata.np, rdata.nplist],
-            "res": [rdata.nt * rdata.nytrue * (2 if rdata.sigma_res else 1)],
-            "sres": [
-                rdata.nt * rdata.nytrue * (2 if rdata.sigma_res else 1),
-                rdata.nplist,
-            ],
-            "FIM": [rdata.nplist, rdata.nplist],
-            # diagnosis
-            "J": [rdata.nx_solver, rdata.nx_solver],
-            "w": [rdata.nt, rdata.nw],
-            "xdot": [rdata.nx_solver],
-            "preeq_numlinsteps": [rdata.newton_maxsteps, 2],
-            "preeq_numsteps": [1, 3],
-            "preeq_status": [1, 3],
-            "posteq_numlinsteps": [rdata.newton_maxsteps, 2],
-            "posteq_numsteps": [1, 3],
-            "posteq_status": [1, 3],
-            "numsteps": [rdata.nt],
-            "numrhsevals": [rdata.nt],
-            "numerrtestfails": [rdata.nt],
-            "numnonlinsolvconvfails": [rdata.nt],
-            "order": [rdata.nt],
-            "numstepsB": [rdata.nt],
-            "numrhsevalsB": [rdata.nt],
-            "numerrtestfailsB": [rdata.nt],
-            "numnonlinsolvconvfailsB": [rdata.nt],
+            field: [dims[dim] if isinstance(dim, str) else dim for dim in spec]
+            for field, spec in self._field_dimension_spec
         }
+        # entity type => {entity ID => index}
+        self._id_index_cache: dict[str, dict[str, int]] = {}
         super().__init__(rdata)
 
     def __getitem__(
@@ -348,26 +405,26 @@ class ReturnDataView(SwigPtrView):
         if field is None:
             field = _entity_type_from_id(entity_id, self, model)
 
-        if field in {"x", "x0", "x_ss", "sx", "sx0", "sx_ss"}:
-            ids = (model and model.getStateIds()) or self._swigptr.state_ids
-        elif field in {"w"}:
-            ids = (
-                model and model.getExpressionIds()
-            ) or self._swigptr.expression_ids
-        elif field in {"y", "sy", "sigmay"}:
-            ids = (
-                model and model.getObservableIds()
-            ) or self._swigptr.observable_ids
-        elif field in {"sllh"}:
-            ids = (
-                model and model.getParameterIds()
-            ) or self._swigptr.parameter_ids
-        else:
+        try:
+            entity_type = self._by_id_entity_types[field]
+        except KeyError:
             raise NotImplementedError(
                 f"Subsetting `{field}` by ID (`{entity_id}`) "
                 "is not implemented or not possible."
-            )
-        col_index = ids.index(entity_id)
+            ) from None
+
+        # map entity IDs to indices only once per entity type
+        if (id_index := self._id_index_cache.get(entity_type)) is None:
+            ids = (
+                model and getattr(model, f"get{entity_type}Ids")()
+            ) or getattr(self._swigptr, f"{entity_type.lower()}_ids")
+            id_index = {eid: i for i, eid in enumerate(ids)}
+            if id_index:
+                self._id_index_cache[entity_type] = id_index
+        try:
+            col_index = id_index[entity_id]
+        except KeyError:
+            raise ValueError(f"{entity_id!r} is not in list") from None
         return getattr(self, field)[:, ..., col_index]
 
 
@@ -380,7 +437,7 @@ class ExpDataView(SwigPtrView):
     does not change after instantiating an :class:`ExpDataView`.
     """
 
-    _field_names = [
+    _field_names = (
         "ts",
         "observedData",
         "observedDataStdDev",
@@ -389,7 +446,17 @@ class ExpDataView(SwigPtrView):
         "fixedParameters",
         "fixedParametersPreequilibration",
         "fixedParametersPresimulation",
-    ]
+    )
+
+    #: Fields that are not direct members of ``ExpData``, and the names of
+    #: the ``ExpData`` methods to retrieve them on first access
+    _field_getters = {
+        "ts": "getTimepoints",
+        "observedData": "getObservedData",
+        "observedDataStdDev": "getObservedDataStdDev",
+        "observedEvents": "getObservedEvents",
+        "observedEventsStdDev": "getObservedEventsStdDev",
+    }
 
     def __init__(self, edata: ExpDataPtr | ExpData):
         """
@@ -419,37 +486,11 @@ class ExpDataView(SwigPtrView):
                 len(edata.fixedParametersPreequilibration)
             ],
         }
-        edata.ts = edata.ts_
-        edata.observedData = edata.getObservedData()
-        edata.observedDataStdDev = edata.getObservedDataStdDev()
-        edata.observedEvents = edata.getObservedEvents()
-        edata.observedEventsStdDev = edata.getObservedEventsStdDev()
         super().__init__(edata)
 
 
-def _field_as_numpy(
-    field_dimensions: dict[str, list[int]], field: str, data: SwigPtrView
-) -> np.ndarray | float | None:
-    """
-    Convert data object field to numpy array with dimensions according to
-    specified field dimensions
-
-    :param field_dimensions: dimension specifications
-                ``dict({field: list([dim1, dim2, ...])})``
-    :param data: object with fields
-    :param field: Name of field
-
-    :returns: Field Data as numpy array with dimensions according to
-    specified field dimensions
-    """
-    attr = getattr(data, field)
-    if field_dim := field_dimensions.get(field, None):
-        return None if len(attr) == 0 else np.array(attr).reshape(field_dim)
-
-    if isinstance(attr, Number):
-        return float(attr)
-
-    return attr
+#: Entity type symbols by entity ID, for each model or ``ReturnData`` object
+_entity_types_by_id = weakref.WeakKeyDictionary()
 
 
 def _entity_type_from_id(
@@ -458,26 +499,39 @@ def _entity_type_from_id(
     model: amici.Model = None,
 ) -> Literal["x", "y", "w", "p", "k"]:
     """Guess the type of some entity by its ID."""
-    for entity_type, symbol in (
-        ("State", "x"),
-        ("Observable", "y"),
-        ("Expression", "w"),
-        ("Parameter", "p"),
-        ("FixedParameter", "k"),
-    ):
-        if model:
-            if entity_id in getattr(model, f"get{entity_type}Ids")():
-                return symbol
-        else:
-            if entity_id in getattr(
-                rdata
-                if isinstance(rdata, amici.ReturnData)
-                else rdata._swigptr,
-                f"{entity_type.lower()}_ids",
-            ):
-                return symbol
-
-    raise KeyError(f"Unknown symbol {entity_id}.")
+    if model:
+        source = model
+    else:
+        source = (
+            rdata if isinstance(rdata, amici.ReturnData) else rdata._swigptr
+        )
+
+    try:
+        entity_types = _entity_types_by_id[source]
+    except (KeyError, TypeError):
+        # not cached yet, or not weak-referenceable
+        entity_types = {}
+        for entity_type, symbol in (
+            ("State", "x"),
+            ("Observable", "y"),
+            ("Expression", "w"),
+            ("Parameter", "p"),
+            ("FixedParameter", "k"),
+        ):
+            if model:
+                ids = getattr(model, f"get{entity_type}Ids")()
+            else:
+                ids = getattr(source, f"{entity_type.lower()}_ids")
+            # in case of duplicate IDs, the first entity type takes precedence
+            for id_ in ids:
+                entity_types.setdefault(id_, symbol)
+        with contextlib.suppress(TypeError):
+            _entity_types_by_id[source] = entity_types
+
+    try:
+        return entity_types[entity_id]
+    except KeyError:
+        raise KeyError(f"Unknown symbol {entity_id}.") from None
 
 
 def evaluate(expr: StrOrExpr, rdata: ReturnDataView) -> np.array:
@@ -494,12 +548,29 @@ def evaluate(expr: StrOrExpr, rdata: ReturnDataView) -> np.array:
     :return:
         The evaluated expression for the simulation output timepoints.
     """
+    arg_names, func = _compile_expr(expr)
+    args = [rdata.by_id(arg.name) for arg in arg_names]
+    return func(*args)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expr(expr: StrOrExpr) -> tuple[list["sp.Symbol"], Callable]:
+    """Convert a symbolic expression to a numpy function of its free symbols.
+
+    :param expr:
+        A sympy expression or a string that can be sympified.
+
+    :return:
+        The free symbols of the expression in the order of the function
+        arguments, and the function.
+    """
+    import sympy as sp
+    from sympy.abc import _clash
     from sympy.utilities.lambdify import lambdify
 
     if isinstance(expr, str):
         expr = sp.sympify(expr, locals=_clash)
 
-    arg_names = list(sorted(expr.free_symbols, key=lambda x: x.name))
+    arg_names = sorted(expr.free_symbols, key=str)
     func = lambdify(arg_names, expr, "numpy")
-    args = [rdata.by_id(arg.name) for arg in arg_names]
-    return func(*args)
+    return arg_names, func
@@ -3,6 +3,7 @@
 Functions for PEtab import that are independent of the model format.
 """
 
+import functools
 import importlib
 import logging
 import os
@@ -27,6 +28,9 @@ from sympy.abc import _clash
 
 logger = logging.getLogger(__name__)
 
+# string representation of missing values in PEtab tables
+_NAN_PATTERN = re.compile(r"^[nN]a[nN]$")
+
 
 def get_observation_model(
     observable_df: pd.DataFrame,
@@ -48,27 +52,43 @@ def get_observation_model(
     observables = {}
     sigmas = {}
 
-    nan_pat = r"^[nN]a[nN]$"
     for _, observable in observable_df.iterrows():
         oid = str(observable.name)
         # need to sanitize due to https://github.com/PEtab-dev/PEtab/issues/447
-        name = re.sub(nan_pat, "", str(observable.get(OBSERVABLE_NAME, "")))
-        formula_obs = re.sub(nan_pat, "", str(observable[OBSERVABLE_FORMULA]))
-        formula_noise = re.sub(nan_pat, "", str(observable[NOISE_FORMULA]))
+        name = _NAN_PATTERN.sub("", str(observable.get(OBSERVABLE_NAME, "")))
+        formula_obs = _NAN_PATTERN.sub("", str(observable[OBSERVABLE_FORMULA]))
+        formula_noise = _NAN_PATTERN.sub("", str(observable[NOISE_FORMULA]))
         observables[oid] = {"name": name, "formula": formula_obs}
         sigmas[oid] = formula_noise
 
     # PEtab does currently not allow observables in noiseFormula and AMICI
     #  cannot handle states in sigma expressions. Therefore, where possible,
     #  replace species occurring in error model definition by observableIds.
-    replacements = {
-        sp.sympify(observable["formula"], locals=_clash): sp.Symbol(
-            observable_id
+    replacements = []
+    for observable_id, observable in observables.items():
+        expr = _sympify_cached(observable["formula"])
+        replacements.append(
+            (expr, expr.free_symbols, sp.Symbol(observable_id))
         )
-        for observable_id, observable in observables.items()
-    }
     for observable_id, formula in sigmas.items():
-        repl = sp.sympify(formula, locals=_clash).subs(replacements)
+        sigma = _sympify_cached(formula)
+        # an observable formula can only occur in the noise formula if all
+        #  its symbols do
+        sigma_symbols = sigma.free_symbols
+        subs = {
+            expr: observable_sym
+            for expr, expr_symbols, observable_sym in replacements
+            if expr_symbols <= sigma_symbols
+        }
+        if not subs:
+            # nothing to replace, keep the formula as is, like the
+            #  observable formulas
+            continue
+        if all(expr.is_Symbol for expr in subs):
+            # plain renaming, doesn't require the pattern matching of `subs`
+            repl = sigma.xreplace(subs)
+        else:
+            repl = sigma.subs(subs)
         sigmas[observable_id] = str(repl)
 
     noise_distrs = petab_noise_distributions_to_amici(observable_df)
@@ -76,6 +96,16 @@ def get_observation_model(
     return observables, noise_distrs, sigmas
 
 
+@functools.lru_cache(maxsize=None)
+def _sympify_cached(formula: str | float) -> sp.Expr:
+    """Sympify a PEtab math expression.
+
+    Results are cached, as the same formulas are parsed repeatedly during
+    PEtab import. This is safe, since sympy expressions are immutable.
+    """
+    return sp.sympify(formula, locals=_clash)
+
+
 def petab_noise_distributions_to_amici(
     observable_df: pd.DataFrame,
 ) -> dict[str, str]:
@@ -172,6 +202,27 @@ def get_fixed_parameters(
     :return:
         list of IDs of parameters which are to be considered constant.
     """
+    return list(
+        sorted(
+            _get_fixed_parameters_set(
+                petab_problem, non_estimated_parameters_as_constants
+            )
+        )
+    )
+
+
+def _get_fixed_parameters_set(
+    petab_problem: petab.Problem,
+    non_estimated_parameters_as_constants=True,
+) -> set[str]:
+    """
+    Determine fixed model parameters.
+
+    See :func:`get_fixed_parameters`.
+
+    :return:
+        set of IDs of parameters which are to be considered constant.
+    """
     # if we have a parameter table, all parameters that are allowed to be
     #  listed in the parameter table, but are not marked as estimated, can be
     #  turned into AMICI constants
@@ -237,7 +288,7 @@ def get_fixed_parameters(
             )
             fixed_parameters.remove(fixed_parameter)
 
-    return list(sorted(fixed_parameters))
+    return fixed_parameters
 
 
 def check_model(
@@ -17,12 +17,13 @@ the mapping is automatized.
 """
 
 import logging
+import math
 import numbers
 import re
 from collections.abc import Sequence
 from itertools import chain
 from typing import Any, Union
-from collections.abc import Collection, Iterator
+from collections.abc import Callable, Collection, Iterator
 
 import amici
 import numpy as np
@@ -55,6 +56,30 @@ logger = logging.getLogger(__name__)
 SingleParameterMapping = dict[str, Union[numbers.Number, str]]
 SingleScaleMapping = dict[str, str]
 
+# functions to bring parameters from linear scale to the given (non-linear)
+#  PEtab scale, and back
+_SCALE_FUNCS = {LOG10: np.log10, LOG: np.log}
+_UNSCALE_FUNCS = {
+    LOG10: lambda value, **kwargs: np.power(10.0, value, **kwargs),
+    LOG: np.exp,
+}
+# the same for plain Python numbers, avoiding the overhead of NumPy ufuncs
+_SCALE_FUNCS_SCALAR = {LOG10: math.log10, LOG: math.log}
+_UNSCALE_FUNCS_SCALAR = {LOG10: lambda value: 10.0**value, LOG: math.exp}
+_UNKNOWN_SCALE_MESSAGE = (
+    f"Unknown parameter scale {{}}. Must be from {(LIN, LOG, LOG10)}"
+)
+# PEtab scale IDs and the corresponding AMICI scale IDs
+_PETAB_TO_AMICI_SCALE = {
+    LIN: amici.ParameterScaling_none,
+    LOG10: amici.ParameterScaling_log10,
+    LOG: amici.ParameterScaling_ln,
+}
+_AMICI_TO_PETAB_SCALE = {
+    amici_scale: petab_scale
+    for petab_scale, amici_scale in _PETAB_TO_AMICI_SCALE.items()
+}
+
 
 class ParameterMappingForCondition:
     """Parameter mapping for condition.
@@ -85,6 +110,16 @@ class ParameterMappingForCondition:
         Scales for fixed simulation parameters.
     """
 
+    __slots__ = (
+        "_map_sim_var",
+        "scale_map_sim_var",
+        "_map_preeq_fix",
+        "scale_map_preeq_fix",
+        "_map_sim_fix",
+        "scale_map_sim_fix",
+        "_free_symbols",
+    )
+
     def __init__(
         self,
         map_sim_var: SingleParameterMapping = None,
@@ -129,18 +164,63 @@ class ParameterMappingForCondition:
             f"scale_map_sim_fix={repr(self.scale_map_sim_fix)})"
         )
 
+    @property
+    def map_sim_var(self) -> SingleParameterMapping:
+        """Mapping for free simulation parameters."""
+        return self._map_sim_var
+
+    @map_sim_var.setter
+    def map_sim_var(self, value: SingleParameterMapping):
+        self._map_sim_var = value
+        self._free_symbols = None
+
+    @property
+    def map_preeq_fix(self) -> SingleParameterMapping:
+        """Mapping for fixed preequilibration parameters."""
+        return self._map_preeq_fix
+
+    @map_preeq_fix.setter
+    def map_preeq_fix(self, value: SingleParameterMapping):
+        self._map_preeq_fix = value
+        self._free_symbols = None
+
+    @property
+    def map_sim_fix(self) -> SingleParameterMapping:
+        """Mapping for fixed simulation parameters."""
+        return self._map_sim_fix
+
+    @map_sim_fix.setter
+    def map_sim_fix(self, value: SingleParameterMapping):
+        self._map_sim_fix = value
+        self._free_symbols = None
+
     @property
     def free_symbols(self) -> set[str]:
-        """Get IDs of all (symbolic) parameters present in this mapping"""
-        return {
-            p
-            for p in chain(
-                self.map_sim_var.values(),
-                self.map_preeq_fix.values(),
-                self.map_sim_fix.values(),
-            )
-            if isinstance(p, str)
-        }
+        """Get IDs of all (symbolic) parameters present in this mapping
+
+        The result is cached until one of the parameter mappings is
+        reassigned. After modifying a mapping in place, call
+        :meth:`invalidate` to reset the cache.
+        """
+        return set(self._get_free_symbols())
+
+    def _get_free_symbols(self) -> set[str]:
+        """Get the cached set of free symbols. Must not be modified."""
+        if self._free_symbols is None:
+            self._free_symbols = {
+                p
+                for p in chain(
+                    self.map_sim_var.values(),
+                    self.map_preeq_fix.values(),
+                    self.map_sim_fix.values(),
+                )
+                if isinstance(p, str)
+            }
+        return self._free_symbols
+
+    def invalidate(self) -> None:
+        """Reset cached values derived from the parameter mappings."""
+        self._free_symbols = None
 
 
 class ParameterMapping(Sequence):
@@ -152,6 +232,8 @@ class ParameterMapping(Sequence):
         List of parameter mappings for specific conditions.
     """
 
+    __slots__ = ("parameter_mappings",)
+
     def __init__(
         self, parameter_mappings: list[ParameterMappingForCondition] = None
     ):
@@ -186,29 +268,27 @@ class ParameterMapping(Sequence):
     @property
     def free_symbols(self) -> set[str]:
         """Get IDs of all (symbolic) parameters present in this mapping"""
-        return set.union(*(mapping.free_symbols for mapping in self))
+        return set().union(*(mapping._get_free_symbols() for mapping in self))
 
 
 def petab_to_amici_scale(petab_scale: str) -> int:
     """Convert petab scale id to amici scale id."""
-    if petab_scale == LIN:
-        return amici.ParameterScaling_none
-    if petab_scale == LOG10:
-        return amici.ParameterScaling_log10
-    if petab_scale == LOG:
-        return amici.ParameterScaling_ln
-    raise ValueError(f"PEtab scale not recognized: {petab_scale}")
+    try:
+        return _PETAB_TO_AMICI_SCALE[petab_scale]
+    except KeyError:
+        raise ValueError(
+            f"PEtab scale not recognized: {petab_scale}"
+        ) from None
 
 
 def amici_to_petab_scale(amici_scale: int) -> str:
     """Convert amici scale id to petab scale id."""
-    if amici_scale == amici.ParameterScaling_none:
-        return LIN
-    if amici_scale == amici.ParameterScaling_log10:
-        return LOG10
-    if amici_scale == amici.ParameterScaling_ln:
-        return LOG
-    raise ValueError(f"AMICI scale not recognized: {amici_scale}")
+    try:
+        return _AMICI_TO_PETAB_SCALE[amici_scale]
+    except KeyError:
+        raise ValueError(
+            f"AMICI scale not recognized: {amici_scale}"
+        ) from None
 
 
 def scale_parameter(value: numbers.Number, petab_scale: str) -> numbers.Number:
@@ -224,14 +304,13 @@ def scale_parameter(value: numbers.Number, petab_scale: str) -> numbers.Number:
     """
     if petab_scale == LIN:
         return value
-    if petab_scale == LOG10:
-        return np.log10(value)
-    if petab_scale == LOG:
-        return np.log(value)
-    raise ValueError(
-        f"Unknown parameter scale {petab_scale}. "
-        f"Must be from {(LIN, LOG, LOG10)}"
-    )
+    try:
+        scale_func = _SCALE_FUNCS[petab_scale]
+    except KeyError:
+        raise ValueError(_UNKNOWN_SCALE_MESSAGE.format(petab_scale)) from None
+    if type(value) in (float, int) and value > 0:
+        return _SCALE_FUNCS_SCALAR[petab_scale](value)
+    return scale_func(value)
 
 
 def unscale_parameter(
@@ -249,14 +328,17 @@ def unscale_parameter(
     """
     if petab_scale == LIN:
         return value
-    if petab_scale == LOG10:
-        return np.power(10, value)
-    if petab_scale == LOG:
-        return np.exp(value)
-    raise ValueError(
-        f"Unknown parameter scale {petab_scale}. "
-        f"Must be from {(LIN, LOG, LOG10)}"
-    )
+    try:
+        unscale_func = _UNSCALE_FUNCS[petab_scale]
+    except KeyError:
+        raise ValueError(_UNKNOWN_SCALE_MESSAGE.format(petab_scale)) from None
+    if type(value) in (float, int):
+        try:
+            return _UNSCALE_FUNCS_SCALAR[petab_scale](value)
+        except OverflowError:
+            # NumPy returns inf
+            pass
+    return unscale_func(value)
 
 
 def scale_parameters_dict(
@@ -278,8 +360,7 @@ def scale_parameters_dict(
     if value_dict.keys() != petab_scale_dict.keys():
         raise AssertionError("Keys don't match.")
 
-    for key, value in value_dict.items():
-        value_dict[key] = scale_parameter(value, petab_scale_dict[key])
+    _transform_parameters_dict(value_dict, petab_scale_dict, _SCALE_FUNCS)
 
 
 def unscale_parameters_dict(
@@ -301,8 +382,120 @@ def unscale_parameters_dict(
     if value_dict.keys() != petab_scale_dict.keys():
         raise AssertionError("Keys don't match.")
 
-    for key, value in value_dict.items():
-        value_dict[key] = unscale_parameter(value, petab_scale_dict[key])
+    _transform_parameters_dict(value_dict, petab_scale_dict, _UNSCALE_FUNCS)
+
+
+def scale_parameters_array(
+    values: np.ndarray, petab_scales: Sequence[str]
+) -> None:
+    """
+    Bring parameters from linear scale to target scale.
+
+    Bring values in ``values`` from linear scale to the scale
+    provided in ``petab_scales`` (in-place).
+
+    :param values:
+        Values to scale. Floating point array.
+
+    :param petab_scales:
+        Target scales of ``values``, in the same order
+    """
+    _transform_parameters_array(values, petab_scales, _SCALE_FUNCS)
+
+
+def unscale_parameters_array(
+    values: np.ndarray, petab_scales: Sequence[str]
+) -> None:
+    """
+    Bring parameters from target scale to linear scale.
+
+    Bring values in ``values`` from the scale provided in ``petab_scales``
+    to linear scale (in-place).
+
+    :param values:
+        Values to unscale. Floating point array.
+
+    :param petab_scales:
+        Current scales of ``values``, in the same order
+    """
+    _transform_parameters_array(values, petab_scales, _UNSCALE_FUNCS)
+
+
+def _transform_parameters_dict(
+    value_dict: dict[Any, numbers.Number],
+    petab_scale_dict: dict[Any, str],
+    transforms: dict[str, Callable[[np.ndarray], np.ndarray]],
+) -> None:
+    """
+    Apply scale-specific transformations to parameter values (in-place).
+
+    See :func:`_transform_parameters_array`. Values on linear scale are
+    left unchanged.
+
+    :param value_dict:
+        Values to transform
+    :param petab_scale_dict:
+        Scales of ``values``
+    :param transforms:
+        Mapping of PEtab scale IDs other than ``lin`` to vectorized
+        transformations
+    """
+    keys = [
+        key
+        for key, petab_scale in petab_scale_dict.items()
+        if petab_scale != LIN
+    ]
+    if not keys:
+        return
+
+    values = np.fromiter(
+        (value_dict[key] for key in keys), dtype=float, count=len(keys)
+    )
+    _transform_parameters_array(
+        values, [petab_scale_dict[key] for key in keys], transforms
+    )
+    value_dict.update(zip(keys, values))
+
+
+def _transform_parameters_array(
+    values: np.ndarray,
+    petab_scales: Sequence[str],
+    transforms: dict[str, Callable[[np.ndarray], np.ndarray]],
+) -> None:
+    """
+    Apply scale-specific transformations to parameter values (in-place).
+
+    Each transformation is applied only once to all values on the
+    respective scale.
+
+    :param values:
+        Values to transform
+    :param petab_scales:
+        Scales of ``values``
+    :param transforms:
+        Mapping of PEtab scale IDs other than ``lin`` to ufunc-like
+        transformations supporting ``out`` and ``where``
+    """
+    if len(values) != len(petab_scales):
+        raise ValueError(
+            f"Number of values ({len(values)}) and scales "
+            f"({len(petab_scales)}) don't match."
+        )
+    known_scales = {LIN, *transforms}
+    if not known_scales.issuperset(petab_scales):
+        unknown_scale = next(
+            petab_scale
+            for petab_scale in petab_scales
+            if petab_scale not in known_scales
+        )
+        raise ValueError(_UNKNOWN_SCALE_MESSAGE.format(unknown_scale))
+
+    petab_scales = np.asarray(petab_scales)
+    for petab_scale, transform in transforms.items():
+        mask = petab_scales == petab_scale
+        if mask.any():
+            # in-place, without temporary copies, preserving the dtype
+            transform(values, out=values, where=mask)
 
 
 def create_parameter_mapping(
@@ -10,15 +10,14 @@ import amici
 import libsbml
 import petab
 import sympy as sp
-from _collections import OrderedDict
 from amici.logging import log_execution_time, set_log_level
 from petab.models import MODEL_TYPE_SBML
-from sympy.abc import _clash
 
 from . import PREEQ_INDICATOR_ID
 from .import_helpers import (
+    _get_fixed_parameters_set,
+    _sympify_cached,
     check_model,
-    get_fixed_parameters,
     get_observation_model,
 )
 from .util import get_states_in_condition_table
@@ -108,6 +107,24 @@ def import_model_sbml(
         logger.info("Validating PEtab problem ...")
         petab.lint_problem(petab_problem)
 
+    allow_n_noise_pars = (
+        not petab.lint.observable_table_has_nontrivial_noise_formula(
+            petab_problem.observable_df
+        )
+    )
+    if (
+        petab_problem.measurement_df is not None
+        and petab.lint.measurement_table_has_timepoint_specific_mappings(
+            petab_problem.measurement_df,
+            allow_scalar_numeric_noise_parameters=allow_n_noise_pars,
+        )
+    ):
+        raise ValueError(
+            "AMICI does not support importing models with timepoint specific "
+            "mappings for noise or observable parameters. Please flatten "
+            "the problem and try again."
+        )
+
     # Model name from SBML ID or filename
     if model_name is None:
         if not (model_name := petab_problem.model.sbml_model.getId()):
@@ -140,24 +157,6 @@ def import_model_sbml(
     )
     sbml_model = sbml_importer.sbml
 
-    allow_n_noise_pars = (
-        not petab.lint.observable_table_has_nontrivial_noise_formula(
-            petab_problem.observable_df
-        )
-    )
-    if (
-        petab_problem.measurement_df is not None
-        and petab.lint.measurement_table_has_timepoint_specific_mappings(
-            petab_problem.measurement_df,
-            allow_scalar_numeric_noise_parameters=allow_n_noise_pars,
-        )
-    ):
-        raise ValueError(
-            "AMICI does not support importing models with timepoint specific "
-            "mappings for noise or observable parameters. Please flatten "
-            "the problem and try again."
-        )
-
     if petab_problem.observable_df is not None:
         observables, noise_distrs, sigmas = get_observation_model(
             petab_problem.observable_df
@@ -178,43 +177,9 @@ def import_model_sbml(
     #  so we add any output parameters to the SBML model.
     #  this should be changed to something more elegant
     # <BeginWorkAround>
-    formulas = chain(
-        (val["formula"] for val in observables.values()), sigmas.values()
+    _workaround_observable_parameters(
+        observables, sigmas, sbml_model, output_parameter_defaults
     )
-    output_parameters = OrderedDict()
-    for formula in formulas:
-        # we want reproducible parameter ordering upon repeated import
-        free_syms = sorted(
-            sp.sympify(formula, locals=_clash).free_symbols,
-            key=lambda symbol: symbol.name,
-        )
-        for free_sym in free_syms:
-            sym = str(free_sym)
-            if (
-                sbml_model.getElementBySId(sym) is None
-                and sym != "time"
-                and sym not in observables
-            ):
-                output_parameters[sym] = None
-    logger.debug(
-        "Adding output parameters to model: "
-        f"{list(output_parameters.keys())}"
-    )
-    output_parameter_defaults = output_parameter_defaults or {}
-    if extra_pars := (
-        set(output_parameter_defaults) - set(output_parameters.keys())
-    ):
-        raise ValueError(
-            f"Default output parameter values were given for {extra_pars}, "
-            "but they those are not output parameters."
-        )
-
-    for par in output_parameters.keys():
-        _add_global_parameter(
-            sbml_model=sbml_model,
-            parameter_id=par,
-            value=output_parameter_defaults.get(par, 0.0),
-        )
     # <EndWorkAround>
 
     # TODO: to parameterize initial states or compartment sizes, we currently
@@ -222,113 +187,13 @@ def import_model_sbml(
     #  create a new parameter initial_${speciesOrCompartmentID}.
     #  feels dirty and should be changed (see also #924)
     # <BeginWorkAround>
-
-    # state variable IDs and initial values specified via the conditions' table
-    initial_states = get_states_in_condition_table(petab_problem)
-    # is there any condition that involves preequilibration?
-    requires_preequilibration = (
-        petab_problem.measurement_df is not None
-        and petab.PREEQUILIBRATION_CONDITION_ID in petab_problem.measurement_df
-        and petab_problem.measurement_df[petab.PREEQUILIBRATION_CONDITION_ID]
-        .notnull()
-        .any()
-    )
-    estimated_parameters_ids = petab_problem.get_x_ids(free=True, fixed=False)
-    # any initial states overridden to be estimated via the conditions table?
-    has_estimated_initial_states = any(
-        par_id in petab_problem.condition_df[initial_states.keys()].values
-        for par_id in estimated_parameters_ids
-    )
-
-    if (
-        has_estimated_initial_states
-        and requires_preequilibration
-        and kwargs.setdefault("generate_sensitivity_code", True)
-    ):
-        # To support reinitialization of initial conditions after
-        # preequilibration we need fixed parameters for the initial
-        # conditions. If we need sensitivities w.r.t. to initial conditions,
-        # we need to create non-fixed parameters for the initial conditions.
-        # We can't have both for the same state variable.
-        # (We could handle it via separate amici models if pre-equilibration
-        # and estimation of initial values for a given state variable are
-        # used in separate PEtab conditions.)
-        # We currently assume that we do need sensitivities w.r.t. initial
-        # conditions if sensitivities are needed at all.
-        # TODO: check this state by state, then we can support some additional
-        #  cases
-        raise NotImplementedError(
-            "PEtab problems that have both, estimated initial conditions "
-            "specified in the condition table, and preequilibration with "
-            "initial conditions specified in the condition table are not "
-            "supported."
-        )
-
-    fixed_parameters = []
-    if initial_states and requires_preequilibration:
-        # add preequilibration indicator variable
-        if sbml_model.getParameter(PREEQ_INDICATOR_ID) is not None:
-            raise AssertionError(
-                "Model already has a parameter with ID "
-                f"{PREEQ_INDICATOR_ID}. Cannot handle "
-                "species and compartments in condition table "
-                "then."
-            )
-        indicator = sbml_model.createParameter()
-        indicator.setId(PREEQ_INDICATOR_ID)
-        indicator.setName(PREEQ_INDICATOR_ID)
-        # Can only reset parameters after preequilibration if they are fixed.
-        fixed_parameters.append(PREEQ_INDICATOR_ID)
-        logger.debug(
-            "Adding preequilibration indicator "
-            f"constant {PREEQ_INDICATOR_ID}"
-        )
-    logger.debug(
-        f"Adding initial assignments for {list(initial_states.keys())}"
+    fixed_parameters = _workaround_initial_states(
+        petab_problem=petab_problem,
+        sbml_model=sbml_model,
+        generate_sensitivity_code=kwargs.get(
+            "generate_sensitivity_code", True
+        ),
     )
-    for assignee_id in initial_states:
-        init_par_id_preeq = f"initial_{assignee_id}_preeq"
-        init_par_id_sim = f"initial_{assignee_id}_sim"
-        for init_par_id in (
-            [init_par_id_preeq] if requires_preequilibration else []
-        ) + [init_par_id_sim]:
-            if sbml_model.getElementBySId(init_par_id) is not None:
-                raise ValueError(
-                    "Cannot create parameter for initial assignment "
-                    f"for {assignee_id} because an entity named "
-                    f"{init_par_id} exists already in the model."
-                )
-            init_par = sbml_model.createParameter()
-            init_par.setId(init_par_id)
-            init_par.setName(init_par_id)
-            if requires_preequilibration:
-                # must be a fixed parameter to allow reinitialization
-                # TODO: also add other initial condition parameters that are
-                #  not estimated
-                fixed_parameters.append(init_par_id)
-
-        assignment = sbml_model.getInitialAssignment(assignee_id)
-        if assignment is None:
-            assignment = sbml_model.createInitialAssignment()
-            assignment.setSymbol(assignee_id)
-        else:
-            logger.debug(
-                "The SBML model has an initial assignment defined "
-                f"for model entity {assignee_id}, but this entity "
-                "also has an initial value defined in the PEtab "
-                "condition table. The SBML initial assignment will "
-                "be overwritten to handle preequilibration and "
-                "initial values specified by the PEtab problem."
-            )
-        if requires_preequilibration:
-            formula = (
-                f"{PREEQ_INDICATOR_ID} * {init_par_id_preeq} "
-                f"+ (1 - {PREEQ_INDICATOR_ID}) * {init_par_id_sim}"
-            )
-        else:
-            formula = init_par_id_sim
-        math_ast = libsbml.parseL3Formula(formula)
-        assignment.setMath(math_ast)
     # <EndWorkAround>
 
     fixed_parameters.extend(
@@ -342,7 +207,7 @@ def import_model_sbml(
     logger.info(f"Overall fixed parameters: {len(fixed_parameters)}")
     logger.info(
         "Variable parameters: "
-        + str(len(sbml_model.getListOfParameters()) - len(fixed_parameters))
+        + str(sbml_model.getNumParameters() - len(fixed_parameters))
     )
 
     # Create Python module from SBML model
@@ -373,11 +238,9 @@ def import_model_sbml(
 def show_model_info(sbml_model: "libsbml.Model"):
     """Log some model quantities"""
 
-    logger.info(f"Species: {len(sbml_model.getListOfSpecies())}")
-    logger.info(
-        "Global parameters: " + str(len(sbml_model.getListOfParameters()))
-    )
-    logger.info(f"Reactions: {len(sbml_model.getListOfReactions())}")
+    logger.info(f"Species: {sbml_model.getNumSpecies()}")
+    logger.info(f"Global parameters: {sbml_model.getNumParameters()}")
+    logger.info(f"Reactions: {sbml_model.getNumReactions()}")
 
 
 # TODO - remove?!
@@ -429,19 +292,18 @@ def species_to_parameters(
         par.setValue(species.getInitialConcentration())
         par.setUnits(species.getUnits())
 
-    # Remove from reactants and products
+    # Remove from reactants, products, and modifiers
+    transformables_set = set(transformables)
     for reaction in sbml_model.getListOfReactions():
-        for species_id in transformables:
-            # loop, since removeX only removes one instance
-            while reaction.removeReactant(species_id):
-                # remove from reactants
-                pass
-            while reaction.removeProduct(species_id):
-                # remove from products
-                pass
-            while reaction.removeModifier(species_id):
-                # remove from modifiers
-                pass
+        for species_refs in (
+            reaction.getListOfReactants(),
+            reaction.getListOfProducts(),
+            reaction.getListOfModifiers(),
+        ):
+            # iterate backwards, so removal doesn't shift pending indices
+            for i in reversed(range(species_refs.size())):
+                if species_refs.get(i).getSpecies() in transformables_set:
+                    species_refs.remove(i)
 
     return transformables
 
@@ -479,6 +341,196 @@ def _add_global_parameter(
     return p
 
 
+def _workaround_observable_parameters(
+    observables: dict[str, dict[str, str]],
+    sigmas: dict[str, str | float],
+    sbml_model: libsbml.Model,
+    output_parameter_defaults: dict[str, float] | None,
+) -> None:
+    """Add output parameters of the observation model to the SBML model.
+
+    :param observables: observables as returned by
+        :func:`get_observation_model`
+    :param sigmas: noise formulas as returned by :func:`get_observation_model`
+    :param sbml_model: SBML model to add the output parameters to
+    :param output_parameter_defaults: default values for the output
+        parameters, dictionary mapping parameter IDs to default values
+    """
+    formulas = chain(
+        (val["formula"] for val in observables.values()), sigmas.values()
+    )
+    # IDs that are not (or no longer) candidates for output parameters:
+    #  all SIds defined in the model, collected once to avoid a
+    #  `getElementBySId` lookup for every free symbol, time, observables,
+    #  and the output parameters found so far.
+    #  Like `getElementBySId`, this excludes unit definitions, which live in
+    #  a separate namespace (UnitSId), and local parameters, which are only
+    #  visible within their kinetic law.
+    seen_ids = {
+        element.getIdAttribute()
+        for element in sbml_model.getListOfAllElements()
+        if element.isSetIdAttribute()
+        and element.getTypeCode()
+        not in (libsbml.SBML_UNIT_DEFINITION, libsbml.SBML_LOCAL_PARAMETER)
+    }
+    seen_ids.add("time")
+    seen_ids.update(observables)
+    output_parameters = {}
+    for formula in formulas:
+        # we want reproducible parameter ordering upon repeated import
+        free_syms = sorted(_sympify_cached(formula).free_symbols, key=str)
+        for free_sym in free_syms:
+            if (sym := str(free_sym)) in seen_ids:
+                continue
+            seen_ids.add(sym)
+            output_parameters[sym] = None
+    logger.debug(
+        "Adding output parameters to model: "
+        f"{list(output_parameters.keys())}"
+    )
+    output_parameter_defaults = output_parameter_defaults or {}
+    if extra_pars := (
+        set(output_parameter_defaults) - set(output_parameters.keys())
+    ):
+        raise ValueError(
+            f"Default output parameter values were given for {extra_pars}, "
+            "but they those are not output parameters."
+        )
+
+    for par in output_parameters.keys():
+        _add_global_parameter(
+            sbml_model=sbml_model,
+            parameter_id=par,
+            value=output_parameter_defaults.get(par, 0.0),
+        )
+
+
+def _workaround_initial_states(
+    petab_problem: petab.Problem,
+    sbml_model: libsbml.Model,
+    generate_sensitivity_code: bool,
+) -> list[str]:
+    """Add initial assignments for initial values from the condition table.
+
+    :param petab_problem: The PEtab problem
+    :param sbml_model: SBML model to add the initial assignments to
+    :param generate_sensitivity_code: Whether sensitivity code is to be
+        generated for the model
+    :return: IDs of the parameters that need to be constant
+    """
+    # state variable IDs and initial values specified via the conditions' table
+    initial_states = get_states_in_condition_table(petab_problem)
+    # is there any condition that involves preequilibration?
+    requires_preequilibration = (
+        petab_problem.measurement_df is not None
+        and petab.PREEQUILIBRATION_CONDITION_ID in petab_problem.measurement_df
+        and petab_problem.measurement_df[petab.PREEQUILIBRATION_CONDITION_ID]
+        .notnull()
+        .any()
+    )
+    # any initial states overridden to be estimated via the conditions table?
+    #  (only relevant in combination with preequilibration and sensitivities)
+    has_estimated_initial_states = (
+        initial_states
+        and requires_preequilibration
+        and generate_sensitivity_code
+        and not set(
+            petab_problem.condition_df[list(initial_states.keys())]
+            .to_numpy()
+            .ravel()
+            .tolist()
+        ).isdisjoint(petab_problem.get_x_ids(free=True, fixed=False))
+    )
+
+    if has_estimated_initial_states:
+        # To support reinitialization of initial conditions after
+        # preequilibration we need fixed parameters for the initial
+        # conditions. If we need sensitivities w.r.t. to initial conditions,
+        # we need to create non-fixed parameters for the initial conditions.
+        # We can't have both for the same state variable.
+        # (We could handle it via separate amici models if pre-equilibration
+        # and estimation of initial values for a given state variable are
+        # used in separate PEtab conditions.)
+        # We currently assume that we do need sensitivities w.r.t. initial
+        # conditions if sensitivities are needed at all.
+        # TODO: check this state by state, then we can support some additional
+        #  cases
+        raise NotImplementedError(
+            "PEtab problems that have both, estimated initial conditions "
+            "specified in the condition table, and preequilibration with "
+            "initial conditions specified in the condition table are not "
+            "supported."
+        )
+
+    fixed_parameters = []
+    if initial_states and requires_preequilibration:
+        # add preequilibration indicator variable
+        if sbml_model.getParameter(PREEQ_INDICATOR_ID) is not None:
+            raise AssertionError(
+                "Model already has a parameter with ID "
+                f"{PREEQ_INDICATOR_ID}. Cannot handle "
+                "species and compartments in condition table "
+                "then."
+            )
+        indicator = sbml_model.createParameter()
+        indicator.setId(PREEQ_INDICATOR_ID)
+        indicator.setName(PREEQ_INDICATOR_ID)
+        # Can only reset parameters after preequilibration if they are fixed.
+        fixed_parameters.append(PREEQ_INDICATOR_ID)
+        logger.debug(
+            "Adding preequilibration indicator "
+            f"constant {PREEQ_INDICATOR_ID}"
+        )
+    logger.debug(
+        f"Adding initial assignments for {list(initial_states.keys())}"
+    )
+    for assignee_id in initial_states:
+        init_par_id_preeq = f"initial_{assignee_id}_preeq"
+        init_par_id_sim = f"initial_{assignee_id}_sim"
+        for init_par_id in (
+            [init_par_id_preeq] if requires_preequilibration else []
+        ) + [init_par_id_sim]:
+            if sbml_model.getElementBySId(init_par_id) is not None:
+                raise ValueError(
+                    "Cannot create parameter for initial assignment "
+                    f"for {assignee_id} because an entity named "
+                    f"{init_par_id} exists already in the model."
+                )
+            init_par = sbml_model.createParameter()
+            init_par.setId(init_par_id)
+            init_par.setName(init_par_id)
+            if requires_preequilibration:
+                # must be a fixed parameter to allow reinitialization
+                # TODO: also add other initial condition parameters that are
+                #  not estimated
+                fixed_parameters.append(init_par_id)
+
+        assignment = sbml_model.getInitialAssignment(assignee_id)
+        if assignment is None:
+            assignment = sbml_model.createInitialAssignment()
+            assignment.setSymbol(assignee_id)
+        else:
+            logger.debug(
+                "The SBML model has an initial assignment defined "
+                f"for model entity {assignee_id}, but this entity "
+                "also has an initial value defined in the PEtab "
+                "condition table. The SBML initial assignment will "
+                "be overwritten to handle preequilibration and "
+                "initial values specified by the PEtab problem."
+            )
+        if requires_preequilibration:
+            formula = (
+                f"{PREEQ_INDICATOR_ID} * {init_par_id_preeq} "
+                f"+ (1 - {PREEQ_INDICATOR_ID}) * {init_par_id_sim}"
+            )
+        else:
+            formula = init_par_id_sim
+        math_ast = libsbml.parseL3Formula(formula)
+        assignment.setMath(math_ast)
+
+    return fixed_parameters
+
+
 def _get_fixed_parameters_sbml(
     petab_problem: petab.Problem,
     non_estimated_parameters_as_constants=True,
@@ -524,7 +576,7 @@ def _get_fixed_parameters_sbml(
             f"initial assignment for {compartments}"
         )
 
-    fixed_parameters = get_fixed_parameters(
+    fixed_parameters = _get_fixed_parameters_set(
         petab_problem, non_estimated_parameters_as_constants
     )
 
@@ -534,22 +586,59 @@ def _get_fixed_parameters_sbml(
     parser_settings.setModel(sbml_model)
     parser_settings.setParseUnits(libsbml.L3P_NO_UNITS)
 
-    for fixed_parameter in fixed_parameters.copy():
+    rule_targets = {rule.getVariable() for rule in sbml_model.getListOfRules()}
+    initial_assignments = {
+        ia.getSymbol(): ia for ia in sbml_model.getListOfInitialAssignments()
+    }
+
+    for fixed_parameter in list(fixed_parameters):
         # check global parameters
-        if sbml_model.getRuleByVariable(fixed_parameter):
-            fixed_parameters.remove(fixed_parameter)
+        if fixed_parameter in rule_targets:
+            fixed_parameters.discard(fixed_parameter)
             continue
-        if ia := sbml_model.getInitialAssignmentBySymbol(fixed_parameter):
-            sym_math = sp.sympify(
-                libsbml.formulaToL3StringWithSettings(
-                    ia.getMath(), parser_settings
-                )
+        if ia := initial_assignments.get(fixed_parameter):
+            if _is_numeric_math(ia.getMath()):
+                continue
+            formula = libsbml.formulaToL3StringWithSettings(
+                ia.getMath(), parser_settings
             )
-            if not sym_math.evalf().is_Number:
-                fixed_parameters.remove(fixed_parameter)
+            if not sp.sympify(formula).evalf().is_Number:
+                fixed_parameters.discard(fixed_parameter)
                 continue
 
-    return list(sorted(fixed_parameters))
+    return sorted(fixed_parameters)
+
+
+def _is_numeric_math(math: libsbml.ASTNode) -> bool:
+    """Check whether an SBML math expression is a plain arithmetic
+    expression of numbers.
+
+    This is a cheap sufficient check that avoids sympifying the expression.
+    If it fails, the expression may still evaluate to a number.
+
+    :param math: The math AST to check.
+    :return: ``True`` if the expression consists only of finite numbers,
+        the constant pi, and additions, subtractions, and multiplications.
+    """
+    nodes = [math]
+    while nodes:
+        node = nodes.pop()
+        # `INF`, `NaN` and `exponentiale` are left to the sympy check, which
+        #  does not consider them numeric
+        if (
+            node.isNumber()
+            and not (node.isInfinity() or node.isNegInfinity() or node.isNaN())
+        ) or node.getType() == libsbml.AST_CONSTANT_PI:
+            continue
+        # no division or power, which may be undefined (e.g. `1/0`)
+        if node.getType() not in (
+            libsbml.AST_PLUS,
+            libsbml.AST_MINUS,
+            libsbml.AST_TIMES,
+        ):
+            return False
+        nodes.extend(node.getChild(i) for i in range(node.getNumChildren()))
+    return True
 
 
 def _create_model_output_dir_name(
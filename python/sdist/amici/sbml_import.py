@@ -1136,8 +1136,8 @@ class SbmlImporter:
             SBML Ids identifying constant parameters
         """
 
-        if constant_parameters is None:
-            constant_parameters = []
+        # set for fast membership tests
+        constant_parameters = set(constant_parameters or [])
 
         # Ensure specified constant parameters exist in the model
         for parameter in constant_parameters:
@@ -1,8 +1,14 @@
 """Test for ``amici.parameter_mapping``"""
 
+import numpy as np
 from amici.petab.parameter_mapping import (
     ParameterMapping,
     ParameterMappingForCondition,
+    scale_parameter,
+    scale_parameters_array,
+    scale_parameters_dict,
+    unscale_parameter,
+    unscale_parameters_array,
 )
 from amici.testing import skip_on_valgrind
 
@@ -69,3 +75,102 @@ def test_parameter_mapping():
 
     assert isinstance(parameter_mapping[0], ParameterMappingForCondition)
     assert isinstance(parameter_mapping[:], ParameterMapping)
+
+
+@skip_on_valgrind
+def test_parameter_mapping_free_symbols():
+    """Test (cached) free symbols of parameter mappings."""
+    par_map_for_condition = ParameterMappingForCondition(
+        map_sim_var={"sim_par0": 8, "sim_par1": "opt_par0"},
+        map_preeq_fix={"sim_par2": "opt_par1"},
+    )
+    assert par_map_for_condition.free_symbols == {"opt_par0", "opt_par1"}
+
+    # reassigning a mapping resets the cache
+    par_map_for_condition.map_sim_fix = {"sim_par2": "opt_par2"}
+    assert par_map_for_condition.free_symbols == {
+        "opt_par0",
+        "opt_par1",
+        "opt_par2",
+    }
+
+    # in-place modifications require explicit invalidation
+    par_map_for_condition.map_sim_var["sim_par0"] = "opt_par3"
+    par_map_for_condition.invalidate()
+    assert par_map_for_condition.free_symbols == {
+        "opt_par0",
+        "opt_par1",
+        "opt_par2",
+        "opt_par3",
+    }
+
+    parameter_mapping = ParameterMapping(
+        [
+            par_map_for_condition,
+            ParameterMappingForCondition(map_sim_var={"sim_par0": "opt_par4"}),
+        ]
+    )
+    assert parameter_mapping.free_symbols == {
+        "opt_par0",
+        "opt_par1",
+        "opt_par2",
+        "opt_par3",
+        "opt_par4",
+    }
+    assert ParameterMapping().free_symbols == set()
+
+
+@skip_on_valgrind
+def test_scale_parameters():
+    """Test (un)scaling of parameter arrays and dicts."""
+    values = np.array([100.0, 2.0, np.e, 0.1])
+    scales = ["log10", "lin", "log", "log10"]
+
+    scale_parameters_array(values, scales)
+    assert np.allclose(values, [2.0, 2.0, 1.0, -1.0])
+
+    unscale_parameters_array(values, scales)
+    assert np.allclose(values, [100.0, 2.0, np.e, 0.1])
+
+    value_dict = {"p0": 100.0, "p1": 2, "p2": np.e}
+    scale_parameters_dict(
+        value_dict, {"p0": "log10", "p1": "lin", "p2": "log"}
+    )
+    assert np.allclose(list(value_dict.values()), [2.0, 2.0, 1.0])
+    # values on linear scale are left untouched
+    assert value_dict["p1"] == 2 and isinstance(value_dict["p1"], int)
+
+
+def test_scale_parameter():
+    """Test (un)scaling of scalars, consistent with NumPy."""
+    # non-positive values and overflows are handled like in NumPy
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for value, scale, expected in (
+            (100.0, "log10", np.log10(100.0)),
+            (np.e, "log", np.log(np.e)),
+            (0.0, "log10", np.log10(0.0)),
+            (0.0, "log", np.log(0.0)),
+            (-1.0, "log10", np.log10(-1.0)),
+            (-1.0, "log", np.log(-1.0)),
+        ):
+            np.testing.assert_allclose(scale_parameter(value, scale), expected)
+
+        for value, scale, expected in (
+            (2.0, "log10", np.power(10.0, 2.0)),
+            (1.0, "log", np.exp(1.0)),
+            (1000, "log10", np.power(10.0, 1000)),
+            (1000, "log", np.exp(1000)),
+        ):
+            np.testing.assert_allclose(
+                unscale_parameter(value, scale), expected
+            )
+
+        assert scale_parameter(0.0, "log10") == -np.inf
+        assert np.isnan(scale_parameter(-1.0, "log10"))
+        assert unscale_parameter(1000, "log") == np.inf
+
+    # integers are converted to floats, unless on linear scale
+    for func in (scale_parameter, unscale_parameter):
+        assert isinstance(func(2, "log10"), float)
+        assert isinstance(func(2, "log"), float)
+        assert func(2, "lin") == 2 and isinstance(func(2, "lin"), int)
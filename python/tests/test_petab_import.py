@@ -167,3 +167,199 @@ def test_default_output_parameters(simple_sbml_model):
                 compile=False,
                 model_output_dir=outdir,
             )
+
+
+@skip_on_valgrind
+def test_output_parameter_unit_definition_id_clash(simple_sbml_model):
+    """Output parameters are created, even if their ID matches a unit
+    definition ID, since unit definitions live in a separate namespace."""
+    from amici.petab.petab_import import import_model
+    from petab.models.sbml_model import SbmlModel
+
+    sbml_doc, sbml_model = simple_sbml_model
+    unit_definition = sbml_model.createUnitDefinition()
+    unit_definition.setId("observableParameter1_obs1")
+    unit = unit_definition.createUnit()
+    unit.setKind(libsbml.UNIT_KIND_SECOND)
+    unit.setExponent(1)
+    unit.setScale(0)
+    unit.setMultiplier(1)
+
+    condition_df = petab.get_condition_df(
+        pd.DataFrame({petab.CONDITION_ID: ["condition0"]})
+    )
+    parameter_df = petab.get_parameter_df(
+        pd.DataFrame({petab.PARAMETER_ID: [], petab.ESTIMATE: []})
+    )
+    observable_df = petab.get_observable_df(
+        pd.DataFrame(
+            {
+                petab.OBSERVABLE_ID: ["obs1"],
+                petab.OBSERVABLE_FORMULA: ["observableParameter1_obs1"],
+                petab.NOISE_FORMULA: [1],
+            }
+        )
+    )
+    petab_problem = petab.Problem(
+        model=SbmlModel(sbml_model),
+        parameter_df=parameter_df,
+        condition_df=condition_df,
+        observable_df=observable_df,
+    )
+
+    with TemporaryDirectoryWinSafe() as outdir:
+        sbml_importer = import_model(
+            petab_problem=petab_problem,
+            output_parameter_defaults={"observableParameter1_obs1": 2.0},
+            compile=False,
+            model_output_dir=outdir,
+        )
+        parameter = sbml_importer.sbml.getParameter(
+            "observableParameter1_obs1"
+        )
+        assert parameter is not None
+        assert parameter.getValue() == 2.0
+
+
+@skip_on_valgrind
+def test_get_observation_model():
+    """Check replacement of observable formulas in noise formulas."""
+    import sympy as sp
+    from amici.petab.import_helpers import get_observation_model
+
+    observable_df = petab.get_observable_df(
+        pd.DataFrame(
+            {
+                petab.OBSERVABLE_ID: ["obs1", "obs2", "obs3", "obs4"],
+                petab.OBSERVABLE_FORMULA: ["x1", "x2 + p1", "x3", "p2 * x4"],
+                petab.NOISE_FORMULA: [
+                    # observable formula is a symbol
+                    "0.1 * x1 + noiseParameter1_obs1",
+                    # observable formula is not a symbol
+                    "x2 + p1 + noiseParameter1_obs2",
+                    # numeric
+                    1,
+                    # no observable formula to replace
+                    "2 * noiseParameter1_obs4",
+                ],
+            }
+        )
+    )
+    observables, noise_distrs, sigmas = get_observation_model(observable_df)
+
+    assert observables == {
+        "obs1": {"name": "", "formula": "x1"},
+        "obs2": {"name": "", "formula": "x2 + p1"},
+        "obs3": {"name": "", "formula": "x3"},
+        "obs4": {"name": "", "formula": "p2 * x4"},
+    }
+    assert noise_distrs == dict.fromkeys(observables, "normal")
+    assert sp.sympify(sigmas["obs1"]) == sp.sympify(
+        "0.1 * obs1 + noiseParameter1_obs1"
+    )
+    assert sp.sympify(sigmas["obs2"]) == sp.sympify(
+        "obs2 + noiseParameter1_obs2"
+    )
+    assert float(sigmas["obs3"]) == 1.0
+    # formulas without replacements are passed on unchanged
+    assert sigmas["obs4"] == "2 * noiseParameter1_obs4"
+
+
+@skip_on_valgrind
+def test_get_fixed_parameters_initial_assignments():
+    """Check that only parameters with numeric initial assignments and
+    no rules are fixed."""
+    from amici.petab.sbml_import import _get_fixed_parameters_sbml
+    from petab.models.sbml_model import SbmlModel
+
+    document = libsbml.SBMLDocument(3, 1)
+    model = document.createModel()
+    for par_idx in range(1, 11):
+        p = model.createParameter()
+        p.setId(f"p{par_idx}")
+        p.setConstant(False)
+        p.setValue(par_idx)
+
+    initial_assignments = {
+        # numeric
+        "p1": "2 * 3 + 1",
+        # symbolic
+        "p2": "p1 * 2",
+        # not considered numeric
+        "p3": "INF",
+        "p8": "NaN",
+        "p9": "exponentiale",
+        # numeric, requires evaluation
+        "p6": "1 / 4",
+        # undefined
+        "p7": "1 / 0",
+        # numeric constant
+        "p10": "pi",
+    }
+    for par_id, formula in initial_assignments.items():
+        ia = model.createInitialAssignment()
+        ia.setSymbol(par_id)
+        ia.setMath(libsbml.parseL3Formula(formula))
+
+    rule = model.createAssignmentRule()
+    rule.setVariable("p4")
+    rule.setMath(libsbml.parseL3Formula("p5 * 2"))
+
+    petab_problem = petab.Problem(
+        model=SbmlModel(model),
+        condition_df=petab.get_condition_df(
+            pd.DataFrame({petab.CONDITION_ID: ["condition0"]})
+        ),
+        parameter_df=petab.get_parameter_df(
+            pd.DataFrame({petab.PARAMETER_ID: [], petab.ESTIMATE: []})
+        ),
+    )
+    assert _get_fixed_parameters_sbml(petab_problem) == [
+        "p1",
+        "p10",
+        "p5",
+        "p6",
+    ]
+
+
+@skip_on_valgrind
+def test_species_to_parameters():
+    """Check that converted species are removed from all reactions."""
+    from amici.petab.sbml_import import species_to_parameters
+
+    document = libsbml.SBMLDocument(3, 1)
+    model = document.createModel()
+    c = model.createCompartment()
+    c.setId("c1")
+    c.setSize(1.0)
+    for species_id, initial_concentration in (
+        ("x1", 2.0),
+        ("x2", 3.0),
+        ("x3", 4.0),
+    ):
+        s = model.createSpecies()
+        s.setId(species_id)
+        s.setCompartment("c1")
+        s.setHasOnlySubstanceUnits(False)
+        s.setInitialConcentration(initial_concentration)
+
+    for reaction_id in ("r1", "r2"):
+        r = model.createReaction()
+        r.setId(reaction_id)
+        for species_id in ("x1", "x2", "x1"):
+            r.createReactant().setSpecies(species_id)
+        for species_id in ("x1", "x3"):
+            r.createProduct().setSpecies(species_id)
+        for species_id in ("x3", "x1"):
+            r.createModifier().setSpecies(species_id)
+
+    assert species_to_parameters(["x1", "x3"], model) == ["x1", "x3"]
+
+    assert model.getSpecies("x1") is None
+    assert model.getSpecies("x3") is None
+    assert model.getParameter("x1").getValue() == 2.0
+    assert model.getParameter("x3").getValue() == 4.0
+    for r in model.getListOfReactions():
+        assert [sr.getSpecies() for sr in r.getListOfReactants()] == ["x2"]
+        assert r.getNumProducts() == 0
+        assert r.getNumModifiers() == 0
@@ -480,6 +480,22 @@ def test_expdata_and_expdataview_are_deepcopyable():
     assert ev2._swigptr.this != ev1._swigptr.this
     assert ev1 == ev2
 
+    # shallow copies and deepcopies of shallow copies keep the class and
+    #  can retrieve all fields, including those exposed through getters
+    ev3 = copy.copy(amici.ExpDataView(edata1))
+    ev4 = copy.deepcopy(copy.copy(amici.ExpDataView(edata1)))
+    assert isinstance(ev3, amici.ExpDataView)
+    assert isinstance(ev4, amici.ExpDataView)
+    assert ev3._swigptr.this == ev1._swigptr.this
+    assert ev4._swigptr.this != ev1._swigptr.this
+    for ev in (ev3, ev4):
+        assert list(ev) == list(ev1)
+        for field in ev1:
+            if ev1[field] is None:
+                assert ev[field] is None
+            else:
+                np.testing.assert_array_equal(ev[field], ev1[field])
+
 
 def test_solvers_are_deepcopyable():
     for solver_type in (amici.CVodeSolver, amici.IDASolver):
@@ -11,3 +11,27 @@ using namespace amici;
 
 // Process symbols in header
 %include "amici/rdata.h"
+
+// Fetch all dimensions required by ReturnDataView at once, instead of
+// accessing each of them separately through the Python/C++ boundary
+%feature("docstring") amici::ReturnData::_get_dimensions
+"Get the dimensions of the ReturnData fields as :class:`dict`.";
+%extend amici::ReturnData {
+    PyObject* _get_dimensions() const {
+        return Py_BuildValue(
+            "{s:i,s:i,s:i,s:i,s:i,s:i,s:i,s:i,s:i,s:i,s:i,s:O}",
+            "nt", $self->nt,
+            "nx", $self->nx,
+            "nx_solver", $self->nx_solver,
+            "nplist", $self->nplist,
+            "np", $self->np,
+            "ny", $self->ny,
+            "nytrue", $self->nytrue,
+            "nz", $self->nz,
+            "nmaxevent", $self->nmaxevent,
+            "nw", $self->nw,
+            "newton_maxsteps", $self->newton_maxsteps,
+            "sigma_res", $self->sigma_res ? Py_True : Py_False
+        );
+    }
+}